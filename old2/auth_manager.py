@@ -6,6 +6,7 @@ Handles secure authentication for public web interface
 
 import os
 import hashlib
+import hmac
 import secrets
 import time
 import json
@@ -145,16 +146,20 @@ class AuthManager:
     def verify_admin_password(self, password: str) -> bool:
         """Verify admin password"""
         try:
-            if not self.auth_config.get('admin_password_hash'):
+            stored = self.auth_config.get('admin_password_hash')
+            if not stored:
+                # Burn the same PBKDF2 cost against a dummy salt so a
+                # missing admin hash isn't detectable by response time
+                hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'),
+                                    b'dummy-salt', 100000)
                 return False
-                
-            stored = self.auth_config['admin_password_hash']
+
             password_hash = hashlib.pbkdf2_hmac('sha256',
                                                password.encode('utf-8'),
                                                stored['salt'].encode('utf-8'),
                                                100000)
-            
-            return password_hash.hex() == stored['hash']
+
+            return hmac.compare_digest(password_hash.hex(), stored['hash'])
         except Exception as e:
             print(f"Error verifying admin password: {e}")
             return False
@@ -209,9 +214,10 @@ class AuthManager:
         if session and session.is_valid:
             return session
         elif session:
-            # Remove expired session
+            # Remove expired session; persisting is left to the next
+            # create/revoke/cleanup so a lookup never pays the file
+            # write (expired entries are filtered on load anyway)
             del self.sessions[token]
-            self._save_sessions()
         return None
         
     def revoke_session(self, token: str) -> bool:
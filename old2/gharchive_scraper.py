@@ -19,11 +19,13 @@ Features:
 
 import argparse
 import asyncio
+import gc
 import gzip
 import json
 import logging
 import os
 import re
+import math
 import sys
 import tempfile
 import time
@@ -70,6 +72,19 @@ class ProcessingStats:
         self.memory_peak_mb = max(self.memory_peak_mb, other.memory_peak_mb)
 
 
+def _tune_gc(phase, info):
+    """Adapt the gen-0 threshold after each full collection: scale it
+    with the live long-lived heap (the M = L + sqrt(L) heuristic) so a
+    scraper holding millions of long-lived event objects does not pay
+    full collections at the default 700-allocation cadence. The gen-2
+    walk is O(live objects) but only runs after the rare full
+    collections this callback fires on."""
+    if phase != 'stop' or info.get('generation') != 2:
+        return
+    long_lived = len(gc.get_objects(generation=2))
+    gc.set_threshold(max(700, int(math.sqrt(long_lived)) + 11), 10, 10)
+
+
 class ResourceMonitor:
     """Monitor system resources and enforce limits for Oracle Cloud safety"""
     
@@ -79,19 +94,49 @@ class ResourceMonitor:
         self.start_time = time.time()
         self.temp_files = set()
         self.emergency_mode = False
-        
+        self.last_temp_cleanup = 0.0
+        self._snapshot = None
+        self._snapshot_ts = 0.0
+
+        # Baseline thresholds, then let the module-level _tune_gc
+        # callback adapt the gen-0 trigger. Registered at most once per
+        # process: the warm worker builds a fresh scraper (and monitor)
+        # per start command, and a bound-method callback would pin every
+        # one of them in gc.callbacks forever
+        gc.set_threshold(700, 10, 10)
+        if _tune_gc not in gc.callbacks:
+            gc.callbacks.append(_tune_gc)
+
+    def _resource_snapshot(self, max_age: float = 0.5) -> Tuple[float, float, float, float]:
+        """One psutil pass (memory MB, disk used/total GB, CPU %) shared
+        by every check within max_age seconds; limit checks fire often
+        enough that uncached procfs reads add up"""
+        now = time.monotonic()
+        if self._snapshot is None or now - self._snapshot_ts > max_age:
+            with self.process.oneshot():
+                memory_mb = self.process.memory_info().rss / 1024 / 1024
+                cpu_percent = self.process.cpu_percent()
+            usage = psutil.disk_usage('.')
+            self._snapshot = (memory_mb, usage.used / (1024**3),
+                              usage.total / (1024**3), cpu_percent)
+            self._snapshot_ts = now
+        return self._snapshot
+
     def get_memory_usage(self) -> float:
         """Get current memory usage in MB"""
-        return self.process.memory_info().rss / 1024 / 1024
+        return self._resource_snapshot()[0]
     
     def get_disk_usage(self, path: str = '.') -> Tuple[float, float]:
         """Get disk usage in GB (used, total)"""
-        usage = psutil.disk_usage(path)
-        return usage.used / (1024**3), usage.total / (1024**3)
+        if path != '.':
+            usage = psutil.disk_usage(path)
+            return usage.used / (1024**3), usage.total / (1024**3)
+        snapshot = self._resource_snapshot()
+        return snapshot[1], snapshot[2]
     
     def get_cpu_usage(self) -> float:
         """Get CPU usage percentage"""
-        return self.process.cpu_percent()
+        return self._resource_snapshot()[3]
     
     def check_memory_limit(self) -> bool:
         """Check if memory usage is within safe limits"""
@@ -125,32 +170,62 @@ class ResourceMonitor:
         self.emergency_mode = True
         logging.warning("Performing emergency cleanup due to resource pressure")
         
-        # Force garbage collection
-        import gc
+        # Force garbage collection; this path only runs once the
+        # pressure threshold is already exceeded
         gc.collect()
         
         # Clean up temp files
-        self.cleanup_temp_files()
+        self.cleanup_temp_files(force=True)
         
-        # Log current resource usage
-        memory_mb = self.get_memory_usage()
-        used_gb, total_gb = self.get_disk_usage()
-        cpu_percent = self.get_cpu_usage()
+        # Log current resource usage (fresh snapshot post-cleanup)
+        self._snapshot = None
+        memory_mb, used_gb, total_gb, cpu_percent = self._resource_snapshot()
         
         logging.info(f"Post-cleanup: Memory: {memory_mb:.1f}MB, Disk: {used_gb:.1f}GB, CPU: {cpu_percent:.1f}%")
         
         self.emergency_mode = False
     
-    def cleanup_temp_files(self):
+    def cleanup_temp_files(self, force: bool = False):
         """Clean up temporary files"""
-        for temp_file in list(self.temp_files):
+        # Resource-pressure checks can call this on every iteration;
+        # throttle the deletion pass unless the caller insists
+        now = time.monotonic()
+        if not force and now - self.last_temp_cleanup < 10.0:
+            return
+        self.last_temp_cleanup = now
+
+        # Group by parent directory and unlink relative to an open dir
+        # fd: one path walk per directory instead of an exists() stat
+        # plus a full-path remove per file. Capped per pass so a huge
+        # backlog can't stall the caller.
+        batch = list(self.temp_files)[:1000]
+        by_dir: Dict[str, List[str]] = {}
+        for temp_file in batch:
+            parent, name = os.path.split(temp_file)
+            by_dir.setdefault(parent or '.', []).append(name)
+
+        for parent, names in by_dir.items():
             try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    logging.debug(f"Cleaned up temp file: {temp_file}")
-                self.temp_files.discard(temp_file)
-            except Exception as e:
-                logging.warning(f"Failed to clean up temp file {temp_file}: {e}")
+                dir_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                # Directory itself is gone; nothing left to delete
+                for name in names:
+                    self.temp_files.discard(os.path.join(parent, name))
+                continue
+            try:
+                for name in names:
+                    temp_file = os.path.join(parent, name)
+                    try:
+                        os.unlink(name, dir_fd=dir_fd)
+                        logging.debug(f"Cleaned up temp file: {temp_file}")
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logging.warning(f"Failed to clean up temp file {temp_file}: {e}")
+                        continue
+                    self.temp_files.discard(temp_file)
+            finally:
+                os.close(dir_fd)
     
     def register_temp_file(self, filepath: str):
         """Register a temporary file for cleanup"""
@@ -158,9 +233,7 @@ class ResourceMonitor:
     
     def should_pause_processing(self) -> bool:
         """Check if processing should be paused due to resource pressure"""
-        memory_mb = self.get_memory_usage()
-        used_gb, _ = self.get_disk_usage()
-        cpu_percent = self.get_cpu_usage()
+        memory_mb, used_gb, _, cpu_percent = self._resource_snapshot()
         
         memory_ratio = memory_mb / self.config.MAX_MEMORY_MB
         disk_ratio = used_gb / self.config.MAX_DISK_USAGE_GB
@@ -176,9 +249,7 @@ class ResourceMonitor:
     
     def get_status(self) -> Dict:
         """Get current resource status"""
-        memory_mb = self.get_memory_usage()
-        used_gb, total_gb = self.get_disk_usage()
-        cpu_percent = self.get_cpu_usage()
+        memory_mb, used_gb, total_gb, cpu_percent = self._resource_snapshot()
         uptime = time.time() - self.start_time
         
         return {
@@ -452,18 +523,39 @@ class DatabaseManager:
         
         -- Search optimization indexes
         CREATE INDEX IF NOT EXISTS idx_github_events_created_at ON github_events (created_at);
+
+        -- Keyset pagination over the event feed walks (created_at, id)
+        -- descending; the compound index makes each page an index-range
+        -- read regardless of how deep the client has paged
+        CREATE INDEX IF NOT EXISTS idx_github_events_created_at_id
+        ON github_events (created_at DESC, id DESC);
+
+        -- Events arrive in rough created_at order, so a BRIN index gives
+        -- the planner a tiny block-range map for wide date filters where
+        -- the btree above would be a much larger structure to traverse
+        CREATE INDEX IF NOT EXISTS idx_github_events_created_at_brin
+        ON github_events USING BRIN (created_at) WITH (pages_per_range = 32);
         CREATE INDEX IF NOT EXISTS idx_github_events_type ON github_events (type);
         CREATE INDEX IF NOT EXISTS idx_github_events_actor_id ON github_events (actor_id);
         CREATE INDEX IF NOT EXISTS idx_github_events_repo_id ON github_events (repo_id);
         CREATE INDEX IF NOT EXISTS idx_github_events_actor_login ON github_events (actor_login);
         CREATE INDEX IF NOT EXISTS idx_github_events_repo_name ON github_events (repo_name);
         CREATE INDEX IF NOT EXISTS idx_github_events_payload ON github_events USING GIN (payload);
+
+        -- Trigram indexes so ILIKE '%term%' searches use an index scan
+        -- instead of a sequential scan (requires pg_trgm, enabled above)
+        CREATE INDEX IF NOT EXISTS idx_github_events_repo_name_trgm
+        ON github_events USING GIN (repo_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_github_events_actor_login_trgm
+        ON github_events USING GIN (actor_login gin_trgm_ops);
         
         -- Repository indexes
         CREATE INDEX IF NOT EXISTS idx_repositories_name ON repositories (name);
         CREATE INDEX IF NOT EXISTS idx_repositories_language ON repositories (language);
         CREATE INDEX IF NOT EXISTS idx_repositories_created_at ON repositories (created_at);
         CREATE INDEX IF NOT EXISTS idx_repositories_stars ON repositories (stargazers_count DESC);
+        CREATE INDEX IF NOT EXISTS idx_repositories_stars_id
+        ON repositories (stargazers_count DESC, id DESC);
         CREATE INDEX IF NOT EXISTS idx_repositories_topics ON repositories USING GIN (topics);
         CREATE INDEX IF NOT EXISTS idx_repositories_owner ON repositories (owner_login);
         
@@ -471,6 +563,15 @@ class DatabaseManager:
         CREATE INDEX IF NOT EXISTS idx_repositories_search ON repositories USING GIN (
             to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || coalesce(full_name, ''))
         );
+
+        -- Trigram indexes so the dashboard's ILIKE '%q%' repository
+        -- search is served by bitmap index scans instead of seqscans
+        CREATE INDEX IF NOT EXISTS idx_repositories_name_trgm
+            ON repositories USING GIN (name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_repositories_full_name_trgm
+            ON repositories USING GIN (full_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_repositories_description_trgm
+            ON repositories USING GIN (description gin_trgm_ops);
         
         -- Repository changes indexes
         CREATE INDEX IF NOT EXISTS idx_repo_changes_repo_id ON repository_changes (repo_id);
@@ -1340,21 +1441,25 @@ class GitHubArchiveScraper:
         
         # Get all available files
         available_files = await self.discover_available_files()
-        
-        # Generate expected files from MIN_DATE to yesterday
-        expected_files = set()
-        current_date = self.config.MIN_DATE
         yesterday = datetime.now() - timedelta(days=1)
-        
-        while current_date <= yesterday:
-            for hour in range(24):
-                expected_filename = f"{current_date.strftime('%Y-%m-%d')}-{hour}.json.gz"
-                expected_files.add(expected_filename)
-            current_date += timedelta(days=1)
-        
-        # Find missing files
-        available_set = set(available_files)
-        missing_files = expected_files - available_set
+
+        # Let Postgres generate the expected hourly filenames with
+        # generate_series and anti-join the available set in one query,
+        # instead of building millions of strings in a Python loop
+        async with self.db.pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT expected.filename
+                FROM (
+                    SELECT to_char(d, 'YYYY-MM-DD') || '-' || h || '.json.gz' AS filename
+                    FROM generate_series($1::date, $2::date, interval '1 day') AS d
+                    CROSS JOIN generate_series(0, 23) AS h
+                ) expected
+                LEFT JOIN unnest($3::text[]) AS available(filename)
+                    ON available.filename = expected.filename
+                WHERE available.filename IS NULL
+            """, self.config.MIN_DATE.date(), yesterday.date(), list(available_files))
+
+        missing_files = {row['filename'] for row in rows}
         
         # Convert missing files to date ranges
         missing_ranges = self._group_missing_files_to_ranges(missing_files)
@@ -1925,12 +2030,85 @@ class GitHubArchiveScraper:
         return total_stats
 
 
+async def run_worker():
+    """Long-lived worker mode driven by JSON commands on stdin.
+
+    The API spawns this process once and keeps it warm, so starting a
+    scrape costs a pipe write instead of a fresh interpreter plus all of
+    our imports. Commands are one JSON object per line:
+    {"cmd": "start", "days_back": N} begins a scrape (config is reloaded
+    per run), {"cmd": "stop"} cancels the scrape in flight, and
+    {"cmd": "shutdown"} or EOF exits the worker. Completion is reported
+    back as a JSON line on stdout.
+    """
+    logger = logging.getLogger('gharchive_worker')
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+    )
+
+    scrape_task = None
+
+    async def run_scrape(command):
+        try:
+            config = Config()  # re-read so config edits apply per run
+            async with GitHubArchiveScraper(config) as scraper:
+                days_back = int(command.get('days_back', 1))
+                end_date = datetime.now() - timedelta(days=1)
+                start_date = end_date - timedelta(days=days_back - 1)
+                stats = await scraper.scrape_date_range(start_date, end_date)
+                async with scraper.db.pool.acquire() as conn:
+                    await conn.execute("SELECT refresh_stats_views()")
+            print(json.dumps({'event': 'scrape_complete', 'stats': stats}), flush=True)
+        except asyncio.CancelledError:
+            print(json.dumps({'event': 'scrape_cancelled'}), flush=True)
+            raise
+        except Exception as e:
+            logger.error(f"Worker scrape failed: {e}")
+            print(json.dumps({'event': 'scrape_failed', 'error': str(e)}), flush=True)
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+
+        try:
+            command = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring malformed worker command: {line!r}")
+            continue
+
+        cmd = command.get('cmd')
+        if cmd == 'start':
+            if scrape_task and not scrape_task.done():
+                logger.info("Scrape already in progress, ignoring start command")
+                continue
+            scrape_task = asyncio.create_task(run_scrape(command))
+        elif cmd == 'stop':
+            if scrape_task and not scrape_task.done():
+                scrape_task.cancel()
+                try:
+                    await scrape_task
+                except asyncio.CancelledError:
+                    logger.info("Scrape cancelled")
+        elif cmd == 'shutdown':
+            break
+
+    if scrape_task and not scrape_task.done():
+        scrape_task.cancel()
+        try:
+            await scrape_task
+        except asyncio.CancelledError:
+            pass
+
+
 async def main():
     """Main function with enhanced capabilities"""
     parser = argparse.ArgumentParser(description='GitHub Archive Scraper - Enhanced Python Version')
     parser.add_argument(
-        '--mode', 
-        choices=['scrape', 'discover', 'missing', 'search', 'export', 'catch-up'],
+        '--mode',
+        choices=['scrape', 'discover', 'missing', 'search', 'export', 'catch-up', 'worker'],
         default='scrape',
         help='Operation mode'
     )
@@ -1979,7 +2157,11 @@ async def main():
     
     args = parser.parse_args()
     config = Config()
-    
+
+    if args.mode == 'worker':
+        await run_worker()
+        return
+
     try:
         async with GitHubArchiveScraper(config) as scraper:
             start_time = datetime.now()
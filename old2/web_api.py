@@ -5,12 +5,14 @@ Provides REST API and serves the dashboard on port 8080
 """
 
 import asyncio
+import base64
 import json
 import logging
 import os
 import signal
 import subprocess
 import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -19,29 +21,172 @@ import aiohttp
 from aiohttp import web
 import aiohttp_cors
 import asyncpg
+import orjson
 import psutil
 from dateutil.parser import parse as parse_date
 
 # Import our config and database manager
 from config import Config
 
+
+def _orjson_default(obj):
+    """Serialize asyncpg Records in place; stringify anything else"""
+    if isinstance(obj, asyncpg.Record):
+        return dict(obj)
+    return str(obj)
+
+
+# Supported search filters with their SQL templates, in bitmask order.
+# Every combination is pre-generated below so the handler never rebuilds
+# query strings and asyncpg's statement cache sees a bounded set of texts.
+# The cursor filter implements keyset pagination: deep pages seek via the
+# (created_at, id) ordering instead of scanning and discarding OFFSET rows.
+_SEARCH_FILTERS = (
+    ('type', 'type = ${}'),
+    ('repo_name', 'repo_name ILIKE ${}'),
+    ('actor_login', 'actor_login ILIKE ${}'),
+    ('date_from', 'created_at >= ${}::text::timestamptz'),
+    ('date_to', 'created_at <= ${}::text::timestamptz'),
+    ('cursor', '(created_at, id) < (${}::text::timestamptz, ${}::bigint)'),
+)
+
+
+def _build_search_queries():
+    """Pre-generate search SQL for every filter combination"""
+    queries = {}
+    for mask in range(1 << len(_SEARCH_FILTERS)):
+        clauses = []
+        keys = []
+        position = 0
+        for bit, (key, template) in enumerate(_SEARCH_FILTERS):
+            if mask & (1 << bit):
+                slots = template.count('${}')
+                clauses.append(template.format(*range(position + 1, position + 1 + slots)))
+                position += slots
+                keys.append(key)
+        where_sql = ' AND '.join(clauses) if clauses else '1=1'
+        sql = f"""
+            SELECT id, type, created_at, actor_login, repo_name,
+                   COUNT(*) OVER () AS _total_count
+            FROM github_events
+            WHERE {where_sql}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ${position + 1}
+        """
+        queries[mask] = (sql, tuple(keys))
+    return queries
+
+
+_SEARCH_QUERIES = _build_search_queries()
+
+
+def _decode_cursor(cursor: str):
+    """Decode an opaque pagination cursor into (created_at, id) parts"""
+    timestamp, _, event_id = base64.urlsafe_b64decode(cursor).decode('ascii').partition('|')
+    return timestamp, int(event_id)
+
+
+def _encode_cursor(created_at, event_id) -> str:
+    """Encode the last row's (created_at, id) as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{event_id}".encode('ascii')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+@web.middleware
+async def compression_middleware(request, handler):
+    """Gzip sizeable JSON bodies for clients that accept it
+
+    Search results and file listings run to hundreds of KB of highly
+    repetitive JSON; compressing them is nearly free on the CPU side and
+    a large win for remote dashboards. Small bodies and already-streamed
+    responses are left alone.
+    """
+    response = await handler(request)
+    body = getattr(response, 'body', None)
+    if (body is not None and len(body) > 1024
+            and 'gzip' in request.headers.get('Accept-Encoding', '')):
+        response.enable_compression()
+    return response
+
+
+def _tail_lines(path: Path, lines: int) -> str:
+    """Read the last `lines` lines of a file by seeking backward in
+    64 KB chunks, so the cost tracks the tail size, not the file size"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b''
+        while pos > 0 and buf.count(b'\n') <= lines:
+            step = min(65536, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    return b'\n'.join(buf.splitlines()[-lines:]).decode('utf-8', errors='replace')
+
+
+def orjson_response(data, status: int = 200) -> web.Response:
+    """Drop-in replacement for web.json_response backed by orjson"""
+    return web.Response(
+        body=orjson.dumps(data, default=_orjson_default),
+        status=status,
+        content_type='application/json'
+    )
+
 class DatabaseManager:
     """Simplified database manager for the web API"""
     
     def __init__(self, config: Config):
         self.config = config
         self.pool = None
-        
+
+    @staticmethod
+    async def _init_connection(conn):
+        """Prepare the hot statements once per pooled connection"""
+        conn._web_statements = {
+            'stats_counts': await conn.prepare("""
+                SELECT
+                    (SELECT GREATEST(reltuples::bigint, 0) FROM pg_class
+                     WHERE relname = 'github_events') AS total_events,
+                    (SELECT COUNT(*) FROM repositories) AS total_repos,
+                    (SELECT COUNT(*) FROM processed_files) AS processed_files,
+                    (SELECT MAX(created_at) FROM github_events) AS latest_event
+            """),
+            'event_types': await conn.prepare("""
+                SELECT type, SUM(event_count)::bigint as count
+                FROM daily_event_stats
+                GROUP BY type
+                ORDER BY count DESC
+                LIMIT 10
+            """),
+            'events_page': await conn.prepare("""
+                SELECT id, type, created_at, actor_login, repo_name
+                FROM github_events
+                ORDER BY created_at DESC
+                LIMIT $1
+            """),
+            'repos_page': await conn.prepare("""
+                SELECT id, name, full_name, language, stargazers_count, last_updated_at
+                FROM repositories
+                ORDER BY stargazers_count DESC NULLS LAST
+                LIMIT $1
+            """),
+        }
+
     async def connect(self):
         """Create database connection pool"""
         dsn = f"postgresql://{self.config.DB_USER}:{self.config.DB_PASSWORD}@{self.config.DB_HOST}:{self.config.DB_PORT}/{self.config.DB_NAME}"
         
         try:
+            # Keep enough warm connections for concurrent dashboard and
+            # search traffic; a cold pool forces handlers to pay TCP +
+            # auth setup latency under load
             self.pool = await asyncpg.create_pool(
-                dsn, 
-                min_size=2, 
-                max_size=10,
-                command_timeout=60
+                dsn,
+                min_size=10,
+                max_size=50,
+                statement_cache_size=1024,
+                command_timeout=60,
+                init=self._init_connection
             )
             logging.info("Database connected successfully")
         except Exception as e:
@@ -72,10 +217,27 @@ class WebAPI:
         self.db = DatabaseManager(config)
         self.app = None
         self.scraper_process = None
-        
+
+        # Serialized response bodies keyed by endpoint, cached for a few
+        # seconds so dashboard polling does not hit the database each time
+        self._response_cache = {}
+        self._stats_refresh_task = None
+
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+
+    def _cached_body(self, key: str):
+        """Return cached response bytes for key, or None if stale/missing"""
+        entry = self._response_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_body(self, key: str, body: bytes, ttl: float) -> bytes:
+        """Store serialized response bytes with a TTL and return them"""
+        self._response_cache[key] = (time.monotonic() + ttl, body)
+        return body
         
     async def init_database(self):
         """Initialize database connection"""
@@ -88,7 +250,7 @@ class WebAPI:
             
     def setup_routes(self):
         """Setup API routes"""
-        self.app = web.Application()
+        self.app = web.Application(middlewares=[compression_middleware])
         
         # Setup CORS for external access
         cors = aiohttp_cors.setup(self.app, defaults={
@@ -100,28 +262,29 @@ class WebAPI:
             )
         })
         
+        # Register each route with CORS inline so later additions cannot
+        # silently miss CORS and the route iterator is never materialized
+        def add_route(method, path, handler):
+            cors.add(self.app.router.add_route(method, path, handler))
+
         # API routes
-        self.app.router.add_get('/api/status', self.get_status)
-        self.app.router.add_get('/api/stats', self.get_stats)
-        self.app.router.add_get('/api/events', self.get_events)
-        self.app.router.add_get('/api/repositories', self.get_repositories)
-        self.app.router.add_post('/api/search', self.search_events)
-        self.app.router.add_get('/api/recent-activity', self.get_recent_activity)
-        
+        add_route('GET', '/api/status', self.get_status)
+        add_route('GET', '/api/stats', self.get_stats)
+        add_route('GET', '/api/events', self.get_events)
+        add_route('GET', '/api/repositories', self.get_repositories)
+        add_route('POST', '/api/search', self.search_events)
+        add_route('GET', '/api/recent-activity', self.get_recent_activity)
+
         # Management routes
-        self.app.router.add_post('/api/start-scraper', self.start_scraper)
-        self.app.router.add_post('/api/stop-scraper', self.stop_scraper)
-        self.app.router.add_post('/api/restart-scraper', self.restart_scraper)
-        self.app.router.add_get('/api/scraper-logs', self.get_scraper_logs)
-        self.app.router.add_post('/api/shutdown', self.shutdown_server)
-        
+        add_route('POST', '/api/start-scraper', self.start_scraper)
+        add_route('POST', '/api/stop-scraper', self.stop_scraper)
+        add_route('POST', '/api/restart-scraper', self.restart_scraper)
+        add_route('GET', '/api/scraper-logs', self.get_scraper_logs)
+        add_route('POST', '/api/shutdown', self.shutdown_server)
+
         # Serve dashboard
-        self.app.router.add_get('/', self.serve_dashboard)
-        self.app.router.add_get('/dashboard', self.serve_dashboard)
-        
-        # Add CORS to all routes
-        for route in list(self.app.router.routes()):
-            cors.add(route)
+        add_route('GET', '/', self.serve_dashboard)
+        add_route('GET', '/dashboard', self.serve_dashboard)
     
     async def serve_dashboard(self, request):
         """Serve the dashboard HTML"""
@@ -696,7 +859,7 @@ class WebAPI:
             # Check database connection
             db_connected = await self.db.health_check()
             
-            return web.json_response({
+            return orjson_response({
                 'scraper_running': scraper_running,
                 'database_connected': db_connected,
                 'api_running': True,
@@ -704,148 +867,231 @@ class WebAPI:
             })
         except Exception as e:
             self.logger.error(f"Error getting status: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
+    async def _compute_stats_body(self) -> bytes:
+        """Run the stats queries and cache the serialized body"""
+        async with self.db.pool.acquire() as conn:
+            # One round trip for all the scalar stats; the event count
+            # uses the planner's reltuples estimate instead of an exact
+            # COUNT(*), which is a full-table scan on github_events
+            counts = await conn._web_statements['stats_counts'].fetchrow()
+
+            # Get event type distribution from the daily rollup view
+            # (refreshed after each scrape run) instead of re-grouping
+            # the full github_events table on every cache miss
+            event_types = await conn._web_statements['event_types'].fetch()
+
+            latest_event = counts['latest_event']
+            body = orjson.dumps({
+                'total_events': counts['total_events'] or 0,
+                'total_repositories': counts['total_repos'] or 0,
+                'processed_files': counts['processed_files'] or 0,
+                'latest_event_date': latest_event.strftime('%Y-%m-%d %H:%M') if latest_event else None,
+                'event_types': event_types
+            }, default=_orjson_default)
+            return self._cache_body('stats', body, ttl=60)
+
+    async def _refresh_stats_cache(self):
+        """Background revalidation of the stats body"""
+        try:
+            await self._compute_stats_body()
+        except Exception as e:
+            self.logger.error(f"Error refreshing stats cache: {e}")
+        finally:
+            self._stats_refresh_task = None
+
     async def get_stats(self, request):
         """Get database statistics"""
         try:
-            async with self.db.pool.acquire() as conn:
-                # Get basic counts
-                total_events = await conn.fetchval("SELECT COUNT(*) FROM github_events") or 0
-                total_repos = await conn.fetchval("SELECT COUNT(*) FROM repositories") or 0
-                processed_files = await conn.fetchval("SELECT COUNT(*) FROM processed_files") or 0
-                
-                # Get latest event date
-                latest_event = await conn.fetchval(
-                    "SELECT MAX(created_at) FROM github_events"
-                )
-                
-                # Get event type distribution
-                event_types = await conn.fetch("""
-                    SELECT type, COUNT(*) as count 
-                    FROM github_events 
-                    GROUP BY type 
-                    ORDER BY count DESC 
-                    LIMIT 10
-                """)
-                
-                return web.json_response({
-                    'total_events': total_events,
-                    'total_repositories': total_repos,
-                    'processed_files': processed_files,
-                    'latest_event_date': latest_event.strftime('%Y-%m-%d %H:%M') if latest_event else None,
-                    'event_types': [dict(row) for row in event_types]
-                })
+            cached = self._cached_body('stats')
+            if cached is not None:
+                return web.Response(body=cached, content_type='application/json')
+
+            # Serve a stale body immediately and revalidate in the
+            # background; no request ever blocks on the aggregate queries
+            # once the cache has been primed
+            stale = self._response_cache.get('stats')
+            if stale is not None:
+                if self._stats_refresh_task is None:
+                    self._stats_refresh_task = asyncio.create_task(
+                        self._refresh_stats_cache()
+                    )
+                return web.Response(body=stale[1], content_type='application/json')
+
+            body = await self._compute_stats_body()
+            return web.Response(body=body, content_type='application/json')
         except Exception as e:
             self.logger.error(f"Error getting stats: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     async def get_events(self, request):
-        """Get recent events"""
+        """Get recent events, streaming rows as they are fetched"""
         try:
-            limit = int(request.query.get('limit', 100))
-            
+            limit = min(int(request.query.get('limit', 100)), 10000)
+
+            # Same streaming shape as search_events: rows go from the
+            # server-side cursor straight to the socket, so neither the
+            # record list nor one giant JSON string sits in memory.
+            # prepare() waits for the first row so acquire/cursor
+            # failures can still return a clean JSON 500
+            response = web.StreamResponse()
+            response.content_type = 'application/json'
+
+            first = True
             async with self.db.pool.acquire() as conn:
-                events = await conn.fetch("""
-                    SELECT id, type, created_at, actor_login, repo_name
-                    FROM github_events 
-                    ORDER BY created_at DESC 
-                    LIMIT $1
-                """, limit)
-                
-                return web.json_response([dict(row) for row in events])
+                async with conn.transaction():
+                    stmt = conn._web_statements['events_page']
+                    async for record in stmt.cursor(limit):
+                        if first:
+                            await response.prepare(request)
+                            await response.write(b'[')
+                            chunk = orjson.dumps(record, default=_orjson_default)
+                            first = False
+                        else:
+                            chunk = b',' + orjson.dumps(record, default=_orjson_default)
+                        await response.write(chunk)
+
+            if first:
+                await response.prepare(request)
+                await response.write(b'[')
+            await response.write(b']')
+            await response.write_eof()
+            return response
         except Exception as e:
             self.logger.error(f"Error getting events: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     async def get_repositories(self, request):
-        """Get repositories"""
+        """Get repositories, streaming rows as they are fetched"""
         try:
-            limit = int(request.query.get('limit', 100))
-            
+            limit = min(int(request.query.get('limit', 100)), 10000)
+
+            response = web.StreamResponse()
+            response.content_type = 'application/json'
+
+            first = True
             async with self.db.pool.acquire() as conn:
-                repos = await conn.fetch("""
-                    SELECT id, name, full_name, language, stargazers_count, last_updated_at
-                    FROM repositories 
-                    ORDER BY stargazers_count DESC NULLS LAST
-                    LIMIT $1
-                """, limit)
-                
-                return web.json_response([dict(row) for row in repos])
+                async with conn.transaction():
+                    stmt = conn._web_statements['repos_page']
+                    async for record in stmt.cursor(limit):
+                        if first:
+                            await response.prepare(request)
+                            await response.write(b'[')
+                            chunk = orjson.dumps(record, default=_orjson_default)
+                            first = False
+                        else:
+                            chunk = b',' + orjson.dumps(record, default=_orjson_default)
+                        await response.write(chunk)
+
+            if first:
+                await response.prepare(request)
+                await response.write(b'[')
+            await response.write(b']')
+            await response.write_eof()
+            return response
         except Exception as e:
             self.logger.error(f"Error getting repositories: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     async def search_events(self, request):
-        """Search events"""
+        """Search events, streaming matching rows as they are fetched"""
         try:
             query = await request.json()
-            
-            where_clauses = []
+
+            # Pick the pre-generated query variant for this filter set;
+            # dates stay as text and are cast in SQL, where Postgres
+            # parses ISO-8601 directly without a Python datetime round trip
+            mask = 0
+            for bit, (key, _template) in enumerate(_SEARCH_FILTERS):
+                if key in query:
+                    mask |= 1 << bit
+            sql, keys = _SEARCH_QUERIES[mask]
+
             params = []
-            param_count = 0
-            
-            # Build dynamic query
-            if 'type' in query:
-                param_count += 1
-                where_clauses.append(f"type = ${param_count}")
-                params.append(query['type'])
-            
-            if 'repo_name' in query:
-                param_count += 1
-                where_clauses.append(f"repo_name ILIKE ${param_count}")
-                params.append(f"%{query['repo_name']}%")
-            
-            if 'actor_login' in query:
-                param_count += 1
-                where_clauses.append(f"actor_login ILIKE ${param_count}")
-                params.append(f"%{query['actor_login']}%")
-            
-            if 'date_from' in query:
-                param_count += 1
-                where_clauses.append(f"created_at >= ${param_count}")
-                params.append(parse_date(query['date_from']))
-            
-            if 'date_to' in query:
-                param_count += 1
-                where_clauses.append(f"created_at <= ${param_count}")
-                params.append(parse_date(query['date_to']))
-            
-            # Build final query
-            where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-            limit = query.get('limit', 100)
-            
-            sql = f"""
-            SELECT id, type, created_at, actor_login, repo_name
-            FROM github_events 
-            WHERE {where_sql}
-            ORDER BY created_at DESC
-            LIMIT {limit}
-            """
-            
+            for key in keys:
+                if key in ('repo_name', 'actor_login'):
+                    params.append(f"%{query[key]}%")
+                elif key in ('date_from', 'date_to'):
+                    params.append(str(query[key])[:64])
+                elif key == 'cursor':
+                    try:
+                        # binascii.Error and the int() failure are both
+                        # ValueErrors, so one catch covers a garbled or
+                        # truncated cursor
+                        params.extend(_decode_cursor(query[key]))
+                    except ValueError:
+                        return orjson_response({'error': 'Invalid cursor'}, status=400)
+                else:
+                    params.append(query[key])
+            params.append(min(int(query.get('limit', 100)), 10000))
+
+            # Stream rows through a server-side cursor instead of buffering
+            # the whole result set and its JSON encoding in memory. The
+            # window count rides along on the first row so a second full
+            # scan for the total is not needed.
+            response = web.StreamResponse()
+            response.content_type = 'application/json'
+
+            first = True
+            last_row = None
             async with self.db.pool.acquire() as conn:
-                events = await conn.fetch(sql, *params)
-                return web.json_response([dict(row) for row in events])
-                
+                async with conn.transaction():
+                    async for record in conn.cursor(sql, *params):
+                        row = dict(record)
+                        total = row.pop('_total_count', None)
+                        last_row = (row['created_at'], row['id'])
+                        if first:
+                            if total is not None:
+                                response.headers['X-Total-Count'] = str(total)
+                            await response.prepare(request)
+                            await response.write(b'{"events":[')
+                            chunk = orjson.dumps(row, default=str)
+                            first = False
+                        else:
+                            chunk = b',' + orjson.dumps(row, default=str)
+                        await response.write(chunk)
+
+            if first:
+                response.headers['X-Total-Count'] = '0'
+                await response.prepare(request)
+                await response.write(b'{"events":[')
+
+            # Hand back the keyset cursor for the next page; clients pass
+            # it as 'cursor' to continue where this page ended
+            if last_row is not None:
+                next_cursor = orjson.dumps(_encode_cursor(*last_row))
+            else:
+                next_cursor = b'null'
+            await response.write(b'],"next_cursor":' + next_cursor + b'}')
+            await response.write_eof()
+            return response
+
         except Exception as e:
             self.logger.error(f"Error searching events: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     async def get_recent_activity(self, request):
         """Get recent activity summary"""
         try:
+            cached = self._cached_body('recent_activity')
+            if cached is not None:
+                return web.Response(body=cached, content_type='application/json')
+
             async with self.db.pool.acquire() as conn:
                 activity = await conn.fetch("""
                     SELECT type, actor_login, repo_name, created_at
-                    FROM github_events 
-                    ORDER BY created_at DESC 
+                    FROM github_events
+                    ORDER BY created_at DESC
                     LIMIT 20
                 """)
-                
-                return web.json_response([dict(row) for row in activity])
+
+                body = orjson.dumps(activity, default=_orjson_default)
+                self._cache_body('recent_activity', body, ttl=30)
+                return web.Response(body=body, content_type='application/json')
         except Exception as e:
             self.logger.error(f"Error getting recent activity: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     def is_scraper_running(self):
         """Check if scraper process is running"""
@@ -860,17 +1106,17 @@ class WebAPI:
         """Start the scraper process"""
         try:
             if self.is_scraper_running():
-                return web.json_response({'error': 'Scraper is already running'}, status=400)
+                return orjson_response({'error': 'Scraper is already running'}, status=400)
             
             # Start scraper in background
             subprocess.Popen([
                 'python3', 'gharchive_scraper.py', '--mode', 'scrape'
             ], cwd='/home/ubuntu/GitArchiver')
             
-            return web.json_response({'message': 'Scraper started successfully'})
+            return orjson_response({'message': 'Scraper started successfully'})
         except Exception as e:
             self.logger.error(f"Error starting scraper: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     async def stop_scraper(self, request):
         """Stop the scraper process"""
@@ -878,12 +1124,12 @@ class WebAPI:
             result = subprocess.run(['pkill', '-f', 'gharchive_scraper.py'], 
                                   capture_output=True)
             if result.returncode == 0:
-                return web.json_response({'message': 'Scraper stopped successfully'})
+                return orjson_response({'message': 'Scraper stopped successfully'})
             else:
-                return web.json_response({'message': 'No scraper process found'})
+                return orjson_response({'message': 'No scraper process found'})
         except Exception as e:
             self.logger.error(f"Error stopping scraper: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     async def restart_scraper(self, request):
         """Restart the scraper process"""
@@ -899,27 +1145,26 @@ class WebAPI:
                 'python3', 'gharchive_scraper.py', '--mode', 'scrape'
             ], cwd='/home/ubuntu/GitArchiver')
             
-            return web.json_response({'message': 'Scraper restarted successfully'})
+            return orjson_response({'message': 'Scraper restarted successfully'})
         except Exception as e:
             self.logger.error(f"Error restarting scraper: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     async def get_scraper_logs(self, request):
         """Get scraper logs"""
         try:
             log_file = Path('/home/ubuntu/GitArchiver/gharchive_scraper.log')
             if log_file.exists():
-                # Get last 1000 lines
-                result = subprocess.run(['tail', '-n', '1000', str(log_file)], 
-                                      capture_output=True, text=True)
-                content = result.stdout
+                # Backward-seek tail in a worker thread: no fork per
+                # request and nothing blocks the event loop on slow disk
+                content = await asyncio.to_thread(_tail_lines, log_file, 1000)
             else:
                 content = "Log file not found"
             
-            return web.json_response({'content': content})
+            return orjson_response({'content': content})
         except Exception as e:
             self.logger.error(f"Error getting logs: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     async def shutdown_server(self, request):
         """Shutdown the API server"""
@@ -930,10 +1175,10 @@ class WebAPI:
             # Schedule server shutdown
             asyncio.create_task(self._delayed_shutdown())
             
-            return web.json_response({'message': 'Server shutdown initiated'})
+            return orjson_response({'message': 'Server shutdown initiated'})
         except Exception as e:
             self.logger.error(f"Error shutting down: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
     async def _delayed_shutdown(self):
         """Delayed shutdown to allow response to be sent"""
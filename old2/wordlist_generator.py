@@ -5,6 +5,8 @@ Analyzes GitHub data to generate relevant wordlists without duplicates or noise
 """
 
 import asyncio
+import concurrent.futures
+import os
 import re
 import json
 import logging
@@ -21,6 +23,32 @@ from config import Config
 from db_manager import GitHubArchiveDB
 
 
+def _filter_and_rank(words: List[str], max_words: int, min_frequency: int,
+                     max_common_word_freq: int, common_words: Set[str],
+                     min_word_length: int, max_word_length: int) -> List[str]:
+    """Pure filter/rank stage, module-level so it can run in a worker process"""
+    if not words:
+        return []
+
+    word_counts = Counter(words)
+
+    # Filter out overly common and rare words
+    filtered_words = {
+        word: count for word, count in word_counts.items()
+        if min_frequency <= count <= max_common_word_freq
+        and word not in common_words
+        and len(word) >= min_word_length
+        and len(word) <= max_word_length
+    }
+
+    # Rank by frequency but prefer medium-frequency words for bug bounty
+    ranked_words = sorted(filtered_words.items(),
+                        key=lambda x: min(x[1], 100),  # Cap frequency impact
+                        reverse=True)
+
+    return [word for word, _ in ranked_words[:max_words]]
+
+
 class WordlistGenerator:
     """Intelligent wordlist generator from GitHub data"""
     
@@ -58,7 +86,18 @@ class WordlistGenerator:
             'technologies': re.compile(r'\b(?:react|angular|vue|node|express|django|flask|spring|laravel|rails)\b', re.I),
             'security_terms': re.compile(r'\b(?:auth|login|admin|password|token|key|secret|api|endpoint|vulnerability)\b', re.I)
         }
-        
+
+        # Worker processes for the CPU-bound filter/rank stage; created
+        # lazily so CLI one-shots that never rank words pay nothing
+        self._cpu_pool = None
+
+    def _ensure_cpu_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._cpu_pool is None:
+            self._cpu_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1)
+            )
+        return self._cpu_pool
+
     async def __aenter__(self):
         """Async context manager entry"""
         await self.db.connect()
@@ -67,6 +106,9 @@ class WordlistGenerator:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         await self.db.disconnect()
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False)
+            self._cpu_pool = None
         
     async def generate_comprehensive_wordlist(self, 
                                             target_domains: Optional[List[str]] = None,
@@ -110,9 +152,10 @@ class WordlistGenerator:
                 target_domains, technology_filter, days_back
             )
             
-            # Filter and rank each category
+            # Filter and rank each category in worker processes so the
+            # event loop (and the API serving it) stays responsive
             for category in wordlists:
-                wordlists[category] = self._filter_and_rank_words(
+                wordlists[category] = await self._filter_and_rank_words_async(
                     wordlists[category], max_words // len(wordlists)
                 )
                 
@@ -177,7 +220,9 @@ class WordlistGenerator:
                             continue
                             
             # Filter and rank words
-            filtered_words = self._filter_and_rank_words(list(all_words.keys()), max_words)
+            filtered_words = await self._filter_and_rank_words_async(
+                list(all_words.keys()), max_words
+            )
             
             self.logger.info(f"Generated {len(filtered_words)} words for {target_domain}")
             return filtered_words
@@ -488,26 +533,20 @@ class WordlistGenerator:
         
     def _filter_and_rank_words(self, words: List[str], max_words: int) -> List[str]:
         """Filter and rank words by relevance"""
-        if not words:
-            return []
-            
-        word_counts = Counter(words)
-        
-        # Filter out overly common and rare words
-        filtered_words = {
-            word: count for word, count in word_counts.items()
-            if self.min_frequency <= count <= self.max_common_word_freq
-            and word not in self.common_words
-            and len(word) >= self.min_word_length
-            and len(word) <= self.max_word_length
-        }
-        
-        # Rank by frequency but prefer medium-frequency words for bug bounty
-        ranked_words = sorted(filtered_words.items(), 
-                            key=lambda x: min(x[1], 100),  # Cap frequency impact
-                            reverse=True)
-        
-        return [word for word, _ in ranked_words[:max_words]]
+        return _filter_and_rank(
+            words, max_words, self.min_frequency, self.max_common_word_freq,
+            self.common_words, self.min_word_length, self.max_word_length
+        )
+
+    async def _filter_and_rank_words_async(self, words: List[str],
+                                           max_words: int) -> List[str]:
+        """Run the filter/rank stage in a worker process"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._ensure_cpu_pool(), _filter_and_rank,
+            words, max_words, self.min_frequency, self.max_common_word_freq,
+            self.common_words, self.min_word_length, self.max_word_length
+        )
         
     async def save_wordlists(self, wordlists: Dict[str, List[str]], 
                            output_dir: Path, prefix: str = "github_wordlist") -> Dict[str, str]: